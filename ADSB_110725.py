@@ -1,27 +1,37 @@
-import csv
-import io
+import hashlib
+import math
 import os
+import pickle
 import sys
 import time
+from collections import OrderedDict, deque
 
 import folium
 # Matplotlib imports for plotting
 import matplotlib
+import numba
+import numpy as np
+import orjson
+import pandas as pd
 import requests
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtWebChannel import QWebChannel
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout,
     QVBoxLayout, QSplitter, QPushButton
 )
-from haversine import haversine, Unit
+from jinja2 import Template
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.colors import LinearSegmentedColormap
 from matplotlib.figure import Figure
+from scipy.spatial import cKDTree
+from shapely.geometry import LineString, mapping, shape
 
 # Ensure matplotlib uses the Qt5Agg backend
 matplotlib.use('Qt5Agg')
 
-# uv add requests folium haversine PyQt5 PyQtWebEngine matplotlib
+# uv add requests folium numba numpy orjson pandas scipy shapely PyQt5 PyQtWebEngine matplotlib
 
 # --- CONFIGURATION ---
 # !!! YOU MUST CHANGE THESE VALUES !!!
@@ -98,6 +108,58 @@ DCA_VOR_LON = -77.036389
 SFRA_RADIUS_METERS = 55560  # 30 NM
 FRZ_RADIUS_METERS = 27780  # 15 NM
 
+# Directory for the filtered airport/border/region data
+CACHE_DIR = '.cache'
+
+# Douglas-Peucker tolerance for border/region outlines, in degrees (~5 km)
+SIMPLIFY_TOLERANCE_DEG = 0.05
+
+# Douglas-Peucker tolerance for aircraft tracks, in degrees, until the map reports its bounds;
+# after that it is this fraction of the visible latitude span (well under a pixel)
+TRACK_SIMPLIFY_TOLERANCE_DEG = 0.0005
+TRACK_SIMPLIFY_SPAN_FRACTION = 1 / 2000
+
+# Mean Earth radius (same value the haversine package uses)
+EARTH_RADIUS_MILES = 3958.7613
+
+# Aircraft label HTML, split around the callsign and the "alt @ gs" text
+# Style text: 9pt, 500 weight, green, 10px right, 7px up, 2 lines
+LABEL_HTML_PREFIX = ('<div style="font-size: 9pt; font-weight: 500; color: #00FF00; margin-left: 10px; '
+                     'margin-top: -7px; line-height: 1.2;"><span style="white-space: nowrap;">')
+LABEL_HTML_MID = '</span><br><span style="white-space: nowrap;">'
+LABEL_HTML_SUFFIX = '</span></div>'
+
+# Number of recently used label HTML strings kept for reuse
+LABEL_CACHE_SIZE = 2048
+
+# Size and anchor (pixels) of the aircraft and airport label icons
+LABEL_ICON_SIZE = (150, 36)
+LABEL_ICON_ANCHOR = (0, 0)
+
+# Above this many points the scatter plots switch to a 2D-histogram density image
+DENSITY_PLOT_THRESHOLD = 50_000
+DENSITY_BINS = (400, 200)
+DENSITY_CMAP = LinearSegmentedColormap.from_list('adsb_green', ['black', '#00FF00'])
+
+
+# Compiled once and cached on disk next to the script; set NUMBA_DISABLE_JIT=1 to debug it as plain Python
+@numba.vectorize(["float64(float64, float64, float64, float64)"], fastmath=True, cache=True)
+def hav_miles(lat1, lon1, lat2, lon2):
+    """Great-circle distance in miles, compiled to a NumPy ufunc (broadcasts scalars and arrays, accepts out=)."""
+    r1 = math.radians(lat1)
+    r2 = math.radians(lat2)
+    dlat = r2 - r1
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat * 0.5) ** 2 + math.cos(r1) * math.cos(r2) * math.sin(dlon * 0.5) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+def toUnitVectors(lats, lons):
+    """Converts lat/lon (degrees) to (x, y, z) points on the unit sphere (ECEF directions)."""
+    lat = np.radians(np.asarray(lats, dtype=float))
+    lon = np.radians(np.asarray(lons, dtype=float))
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
 
 class AdsbMapCanvas(FigureCanvas):
     """Matplotlib canvas for embedding in PyQt."""
@@ -109,6 +171,173 @@ class AdsbMapCanvas(FigureCanvas):
         super().__init__(self.fig)
         self.setParent(parent)
 
+        # Blitting: a full draw caches everything but the animated (data) artists, which
+        # later refreshes paint on top of that background while the axis limits stay put
+        self._animated = []
+        self._background = None
+        self._last_limits = None
+        self.mpl_connect('draw_event', self._on_draw)
+        self.mpl_connect('resize_event', self._on_resize)
+
+    def add_animated(self, *artists):
+        """Marks artists as blitted data artists (left out of the cached background)."""
+        for artist in artists:
+            artist.set_animated(True)
+            self._animated.append(artist)
+
+    def _on_draw(self, event):
+        self._background = self.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _on_resize(self, event):
+        # Re-fit the layout to the new size (the cached background is stale either way)
+        self.fig.tight_layout()
+        self._background = None
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            if artist.get_visible():
+                self.fig.draw_artist(artist)
+
+    def refresh(self, ax):
+        """Redraws after a data update: blits when ax's limits are unchanged, otherwise draws fully."""
+        limits = (ax.get_xlim(), ax.get_ylim())
+        if self._background is None or limits != self._last_limits:
+            self._last_limits = limits
+            self.draw_idle()
+            return
+        self.restore_region(self._background)
+        self._draw_animated()
+        self.blit(self.fig.bbox)
+
+
+class Aircraft:
+    """Latest state of one tracked aircraft."""
+
+    __slots__ = ('lat', 'lon', 'flight', 'alt', 'gs', 'hex')
+
+    def __init__(self, lat, lon, flight, alt, gs, hex):
+        self.lat = lat
+        self.lon = lon
+        self.flight = flight
+        self.alt = alt
+        self.gs = gs  # NaN if missing
+        self.hex = hex
+
+
+class AircraftFetcher(QThread):
+    """Background thread that fetches aircraft.json from dump1090."""
+
+    data_ready = pyqtSignal(dict)
+    fetch_failed = pyqtSignal(str)
+
+    def __init__(self, http, parent=None):
+        super().__init__(parent)
+        self.http = http
+
+    def run(self):
+        try:
+            # Set a short timeout so a dead receiver doesn't hold the thread for long
+            response = self.http.get(DATA_URL, timeout=2.0)
+            response.raise_for_status()  # Raise an error for bad responses
+            self.data_ready.emit(orjson.loads(response.content))
+        except requests.exceptions.RequestException as e:
+            self.fetch_failed.emit(f"Error fetching data: {e}")
+        except Exception as e:
+            self.fetch_failed.emit(f"Error processing data: {e}")
+
+
+class PlotPrepWorker(QObject):
+    """Prepares the scatter plot arrays on a worker thread; Matplotlib itself stays on the GUI thread."""
+
+    prepared = pyqtSignal(object)
+
+    @pyqtSlot(object)
+    def prepare(self, samples):
+        dist, alt, gs, gs_valid = samples
+        # Keep only the pairs where groundspeed is known
+        self.prepared.emit({
+            'dist': pointsOrDensity(dist, alt),
+            'gs': pointsOrDensity(gs[gs_valid], alt[gs_valid]),
+        })
+
+
+class MapRenderSignals(QObject):
+    """Signals for MapRenderer (a QRunnable can't emit signals itself)."""
+
+    html_ready = pyqtSignal(str)
+    render_failed = pyqtSignal(str)
+
+
+class MapRenderer(QRunnable):
+    """Thread pool task that assembles the folium map HTML off the GUI thread."""
+
+    def __init__(self, build, signals):
+        super().__init__()
+        self.build = build
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.signals.html_ready.emit(self.build())
+        except Exception as e:
+            self.signals.render_failed.emit(f"Error building map: {e}")
+
+
+class MapBridge(QObject):
+    """Object exposed to the map page over QWebChannel; relays the visible map bounds."""
+
+    bounds_changed = pyqtSignal(float, float, float, float)
+
+    @pyqtSlot(float, float, float, float)
+    def boundsChanged(self, south, west, north, east):
+        self.bounds_changed.emit(south, west, north, east)
+
+
+class MapScript(folium.MacroElement):
+    """Raw Leaflet JavaScript, rendered after the map it is added to (available as `map`)."""
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            (function (map) {
+                {{ this.code }}
+            })({{ this._parent.get_name() }});
+        {% endmacro %}
+    """)
+
+    def __init__(self, code):
+        super().__init__()
+        self._name = 'MapScript'
+        self.code = code
+
+
+def getCachePath(name, *key_parts):
+    """Builds a cache file path keyed on the values the cached data depends on."""
+    key = hashlib.sha1(",".join(str(part) for part in key_parts).encode()).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"{name}_{key}.pkl")
+
+
+def loadCache(cache_path, source_path):
+    """Returns the cached data if it exists and is newer than its source file, otherwise None."""
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(source_path):
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        print(f"Failed to read cache {cache_path}: {e}")
+        return None
+
+
+def saveCache(cache_path, data):
+    """Writes data to the cache, ignoring failures (the cache is only an optimization)."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(data, f)
+    except Exception as e:
+        print(f"Failed to write cache {cache_path}: {e}")
+
 
 def getAirportLocations():
     # Get airports from https://davidmegginson.github.io/ourairports-data/airports.csv
@@ -129,39 +358,49 @@ def getAirportLocations():
             print(f"Failed to download airports.csv: {e}")
             return {}
 
+    # Reuse the filtered airports from a previous run if nothing changed
+    cache_path = getCachePath('airports', RECEIVER_LAT, RECEIVER_LON, AIRPORT_DISTANCE)
+    airport_locations = loadCache(cache_path, 'airports.csv')
+    if airport_locations is not None:
+        print(f"Loaded {len(airport_locations)} airports from cache")
+        return airport_locations
+
     airport_locations = {}
     try:
-        with open('airports.csv', 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                # Filter for airports within reasonable distance from receiver
-                try:
-                    lat = float(row['latitude_deg'])
-                    lon = float(row['longitude_deg'])
-
-                    # Calculate distance from receiver
-                    airport_pos = (lat, lon)
-                    receiver_pos = (RECEIVER_LAT, RECEIVER_LON)
-                    dist_miles = haversine(receiver_pos, airport_pos, unit=Unit.MILES)
-
-                    # Only include airports within defined distance
-                    if dist_miles <= AIRPORT_DISTANCE:
-                        # Determine if towered or untowered (simple heuristic based on type)
-                        airport_type = row.get('type', '')
-                        if airport_type in ['large_airport', 'medium_airport']:
-                            status = 'towered'
-                        else:
-                            status = 'untowered'
-
-                        # Use ICAO code if available, otherwise use ident
-                        code = row.get('icao_code') or row.get('ident', '')
-                        if code:
-                            airport_locations[code] = (lat, lon, status)
-
-                except (ValueError, TypeError):
-                    continue
+        # Read only the columns we need, straight into columnar arrays
+        # (empty strings stay empty instead of becoming NaN, except for coordinates;
+        # round-trip parsing gives the same floats as float() on each value)
+        df = pd.read_csv('airports.csv',
+                         usecols=['latitude_deg', 'longitude_deg', 'type', 'icao_code', 'ident'],
+                         dtype={'type': 'category', 'icao_code': str, 'ident': str},
+                         keep_default_na=False,
+                         na_values={'latitude_deg': [''], 'longitude_deg': ['']},
+                         float_precision='round_trip')
+        lats = pd.to_numeric(df['latitude_deg'], errors='coerce').to_numpy(dtype=float)
+        lons = pd.to_numeric(df['longitude_deg'], errors='coerce').to_numpy(dtype=float)
+
+        # Skip bad coordinates up front: the fastmath kernel's result is undefined for NaN input
+        valid = np.isfinite(lats) & np.isfinite(lons)
+
+        # Calculate distance from receiver for every valid airport at once
+        dist_miles = hav_miles(RECEIVER_LAT, RECEIVER_LON, lats[valid], lons[valid])
+
+        # Only include airports within defined distance
+        mask = np.zeros(len(df), dtype=bool)
+        mask[valid] = dist_miles <= AIRPORT_DISTANCE
+        nearby = df[mask]
+
+        # Use ICAO code if available, otherwise use ident
+        codes = nearby['icao_code'].where(nearby['icao_code'] != '', nearby['ident'])
+        # Determine if towered or untowered (simple heuristic based on type)
+        towered = nearby['type'].isin(['large_airport', 'medium_airport'])
+
+        for code, lat, lon, is_towered in zip(codes, lats[mask].tolist(), lons[mask].tolist(), towered):
+            if code:
+                airport_locations[code] = (lat, lon, 'towered' if is_towered else 'untowered')
 
         print(f"Loaded {len(airport_locations)} airports within 200 miles")
+        saveCache(cache_path, airport_locations)
 
     except Exception as e:
         print(f"Error reading airports.csv: {e}")
@@ -169,6 +408,69 @@ def getAirportLocations():
     return airport_locations
 
 
+def geometryWithinRange(geometry, max_distance):
+    """Checks if any outer-ring point of a (Multi)Polygon is within max_distance miles of the receiver."""
+    if geometry.get('type') == 'Polygon':
+        rings = geometry.get('coordinates', [[]])[:1]
+    elif geometry.get('type') == 'MultiPolygon':
+        rings = [polygon[0] for polygon in geometry.get('coordinates', []) if polygon]
+    else:
+        return False
+
+    try:
+        rings = [np.asarray(ring, dtype=float)[:, :2] for ring in rings if len(ring)]
+    except (ValueError, TypeError, IndexError):
+        return False
+    if not rings:
+        return False
+
+    # Stack every ring into one array (GeoJSON is [lon, lat])
+    coords = np.concatenate(rings)
+    lon = coords[:, 0]
+    lat = coords[:, 1]
+
+    # Quick reject: skip geometries with no point inside a lat/lon box around the receiver.
+    # The box is widened using the latitude closest to the pole so it never cuts off in-range points.
+    dlat = max_distance / 69.0
+    max_abs_lat = min(abs(RECEIVER_LAT) + dlat, 90.0)
+    dlon = dlat / max(math.cos(math.radians(max_abs_lat)), 0.01)
+    # Longitude difference wrapped to [-180, 180) so receivers near the antimeridian still match
+    dlon_abs = np.abs((lon - RECEIVER_LON + 180.0) % 360.0 - 180.0)
+    in_box = (lat >= RECEIVER_LAT - dlat) & (lat <= RECEIVER_LAT + dlat) & (dlon_abs <= dlon)
+    if not in_box.any():
+        return False
+
+    # Only the points that survived the box test need an exact distance
+    dist_miles = hav_miles(RECEIVER_LAT, RECEIVER_LON, lat[in_box], lon[in_box])
+    return bool(np.any(dist_miles <= max_distance))
+
+
+def trackInBounds(track, bbox):
+    """Checks whether a track's bounding box overlaps bbox (south, west, north, east)."""
+    lats = [point[0] for point in track]
+    lons = [point[1] for point in track]
+    return min(lats) <= bbox[2] and max(lats) >= bbox[0] and min(lons) <= bbox[3] and max(lons) >= bbox[1]
+
+
+def pointsOrDensity(xs, ys):
+    """Returns scatter data as ('points', xs, ys), or as ('density', image, extent) when there are too many points."""
+    if len(xs) <= DENSITY_PLOT_THRESHOLD:
+        return 'points', xs, ys
+    x_max = float(xs.max()) or 1.0
+    y_max = float(ys.max()) or 1.0
+    counts, _, _ = np.histogram2d(xs, ys, bins=DENSITY_BINS, range=[[0, x_max], [0, y_max]])
+    # Log scale so sparse areas stay visible next to dense ones; rows are y for imshow
+    return 'density', np.log1p(counts.T), (0, x_max, 0, y_max)
+
+
+def simplifyFeatures(features, tolerance):
+    """Simplifies each feature's geometry in place (Douglas-Peucker) to cut the vertex count."""
+    for feature in features:
+        geometry = shape(feature['geometry'])
+        feature['geometry'] = mapping(geometry.simplify(tolerance, preserve_topology=True))
+    return features
+
+
 def getWorldBorders():
     # Get data from Eurostat
     url = "https://gisco-services.ec.europa.eu/distribution/v2/countries/geojson/CNTR_RG_10M_2024_4326.geojson"
@@ -188,42 +490,28 @@ def getWorldBorders():
             print(f"Failed to download world_borders.geojson: {e}")
             return None
 
+    # Reuse the filtered GeoJSON from a previous run if nothing changed
+    cache_path = getCachePath('world_borders', RECEIVER_LAT, RECEIVER_LON, WORLD_BORDER_DISTANCE,
+                              SIMPLIFY_TOLERANCE_DEG)
+    cached_data = loadCache(cache_path, 'world_borders.geojson')
+    if cached_data is not None:
+        print("Loaded world borders from cache")
+        return cached_data
+
     try:
-        import json
-        with open('world_borders.geojson', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open('world_borders.geojson', 'rb') as f:
+            data = orjson.loads(f.read())
 
-        receiver_pos = (RECEIVER_LAT, RECEIVER_LON)
         filtered_features = []
 
         for feature in data.get('features', []):
-            # Get geometry coordinates to check if country is nearby
-            geometry = feature.get('geometry', {})
-            if geometry.get('type') == 'Polygon':
-                coords = geometry.get('coordinates', [[]])[0]
-            elif geometry.get('type') == 'MultiPolygon':
-                coords = []
-                for polygon in geometry.get('coordinates', []):
-                    coords.extend(polygon[0])
-            else:
-                continue
-
-            # Check if any point in the geometry is within range
-            within_range = False
-            for coord in coords[:500]:  # Sample first 100 points for performance
-                if len(coord) >= 2:
-                    point_pos = (coord[1], coord[0])  # GeoJSON is [lon, lat]
-                    try:
-                        dist_miles = haversine(receiver_pos, point_pos, unit=Unit.MILES)
-                        if dist_miles <= WORLD_BORDER_DISTANCE:
-                            within_range = True
-                            break
-                    except:
-                        continue
-
-            if within_range:
+            # Check if the country is nearby
+            if geometryWithinRange(feature.get('geometry', {}), WORLD_BORDER_DISTANCE):
                 filtered_features.append(feature)
 
+        # Ship far fewer vertices to Leaflet; the outlines are only drawn as thin lines
+        simplifyFeatures(filtered_features, SIMPLIFY_TOLERANCE_DEG)
+
         # Create new GeoJSON with filtered features
         filtered_data = {
             'type': 'FeatureCollection',
@@ -231,7 +519,9 @@ def getWorldBorders():
         }
 
         print(f"Filtered to {len(filtered_features)} countries within 200nm")
-        return json.dumps(filtered_data)
+        filtered_json = orjson.dumps(filtered_data).decode()
+        saveCache(cache_path, filtered_json)
+        return filtered_json
 
     except Exception as e:
         print(f"Error reading world_borders.geojson: {e}")
@@ -257,12 +547,17 @@ def getRegions():
             print(f"Failed to download regions.geojson: {e}")
             return None
 
+    # Reuse the filtered GeoJSON from a previous run if nothing changed
+    cache_path = getCachePath('regions', RECEIVER_LAT, RECEIVER_LON, REGION_DISTANCE, SIMPLIFY_TOLERANCE_DEG)
+    cached_data = loadCache(cache_path, 'regions.geojson')
+    if cached_data is not None:
+        print("Loaded regions from cache")
+        return cached_data
+
     try:
-        import json
-        with open('regions.geojson', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open('regions.geojson', 'rb') as f:
+            data = orjson.loads(f.read())
 
-        receiver_pos = (RECEIVER_LAT, RECEIVER_LON)
         filtered_features = []
 
         for feature in data.get('features', []):
@@ -274,33 +569,13 @@ def getRegions():
             if levl_code != 2:
                 continue
 
-            # Get geometry coordinates to check if region is nearby
-            geometry = feature.get('geometry', {})
-            if geometry.get('type') == 'Polygon':
-                coords = geometry.get('coordinates', [[]])[0]
-            elif geometry.get('type') == 'MultiPolygon':
-                coords = []
-                for polygon in geometry.get('coordinates', []):
-                    coords.extend(polygon[0])
-            else:
-                continue
-
-            # Check if any point in the geometry is within range
-            within_range = False
-            for coord in coords[:100]:  # Sample first 100 points for performance
-                if len(coord) >= 2:
-                    point_pos = (coord[1], coord[0])  # GeoJSON is [lon, lat]
-                    try:
-                        dist_miles = haversine(receiver_pos, point_pos, unit=Unit.MILES)
-                        if dist_miles <= REGION_DISTANCE:
-                            within_range = True
-                            break
-                    except:
-                        continue
-
-            if within_range:
+            # Check if the region is nearby
+            if geometryWithinRange(feature.get('geometry', {}), REGION_DISTANCE):
                 filtered_features.append(feature)
 
+        # Ship far fewer vertices to Leaflet; the outlines are only drawn as thin lines
+        simplifyFeatures(filtered_features, SIMPLIFY_TOLERANCE_DEG)
+
         # Create new GeoJSON with filtered features
         filtered_data = {
             'type': 'FeatureCollection',
@@ -308,7 +583,9 @@ def getRegions():
         }
 
         print(f"Filtered to {len(filtered_features)} regions within {REGION_DISTANCE} miles")
-        return json.dumps(filtered_data)
+        filtered_json = orjson.dumps(filtered_data).decode()
+        saveCache(cache_path, filtered_json)
+        return filtered_json
 
     except Exception as e:
         print(f"Error reading regions.geojson: {e}")
@@ -318,18 +595,56 @@ def getRegions():
 class AdsbTracker(QMainWindow):
     """Main application window."""
 
+    # Carries buffer views to the plot worker thread
+    plot_requested = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
 
         # --- Airport Locations ---
         self.airport_location = getAirportLocations()
 
+        # Spatial index over the airports so proximity queries are O(log N)
+        # instead of a haversine scan over every airport
+        self.airport_codes = list(self.airport_location)
+        self.airport_meta = [self.airport_location[code] for code in self.airport_codes]
+        self.airport_tree = None
+        if self.airport_codes:
+            lats, lons, _ = zip(*self.airport_meta)
+            self.airport_tree = cKDTree(toUnitVectors(lats, lons))
+
+        # Reuse one HTTP connection to dump1090 (keep-alive) instead of reconnecting every update
+        self.http = requests.Session()
+
+        # Fetch aircraft data on a background thread so a slow receiver can't block the GUI
+        self.fetcher = AircraftFetcher(self.http, self)
+        self.fetcher.data_ready.connect(self._on_data)
+        self.fetcher.fetch_failed.connect(self._on_fetch_failed)
+
+        # Refreshes triggered by new data are coalesced (see schedule_refresh)
+        self._refresh_pending = False
+
+        # Plot data is prepared on its own thread and handed back for drawing
+        self._plot_prep_busy = False
+        self.plot_thread = QThread(self)
+        self.plot_worker = PlotPrepWorker()
+        self.plot_worker.moveToThread(self.plot_thread)
+        self.plot_requested.connect(self.plot_worker.prepare)
+        self.plot_worker.prepared.connect(self._on_plot_data)
+        self.plot_thread.start()
+
         # --- Data Storage ---
-        # These lists will store all data cumulatively
-        self.all_distances = []
-        self.all_altitudes = []
+        # Preallocated buffers that store all data cumulatively; only the first
+        # self._n entries are valid. Missing groundspeeds are stored as NaN.
+        # 1M samples x (3 fields x 4 bytes + 1 byte mask) = ~13 MB
+        self._cap = 1_000_000
+        self._dist_buf = np.empty(self._cap, dtype=np.float32)
+        self._alt_buf = np.empty(self._cap, dtype=np.float32)
         # --- MODIFICATION: Added storage for groundspeed ---
-        self.all_groundspeeds = []
+        self._gs_buf = np.empty(self._cap, dtype=np.float32)
+        # True where the groundspeed sample is known, so plots don't re-test for NaN
+        self._gs_valid = np.zeros(self._cap, dtype=bool)
+        self._n = 0
 
         # To track unique aircraft for smoother map updates
         self.current_aircraft = {}
@@ -338,6 +653,8 @@ class AdsbTracker(QMainWindow):
 
         # --- State for UI toggles ---
         self.show_labels = True
+        # Label HTML by (flight, alt, gs) text, see _fmt_labels
+        self._label_cache = OrderedDict()
         # --- ADDED: State for persistent zoom ---
         self.current_zoom = MAP_START_ZOOM
 
@@ -384,6 +701,27 @@ class AdsbTracker(QMainWindow):
         # --- MODIFICATION: Add map with stretch factor 1 ---
         left_layout.addWidget(self.map_view, 1)
 
+        # The map page is built once; aircraft are pushed into it after it loads
+        self._map_ready = False
+        self._last_map_sig = None
+        self.map_view.loadFinished.connect(self._on_map_loaded)
+
+        # Visible map bounds (south, west, north, east), reported by the page; None until known
+        self._bbox = None
+        self.map_bridge = MapBridge(self)
+        self.map_bridge.bounds_changed.connect(self._on_bounds_changed)
+        self.map_channel = QWebChannel(self.map_view.page())
+        self.map_channel.registerObject('bridge', self.map_bridge)
+        self.map_view.page().setWebChannel(self.map_channel)
+        self._static_rings_js = self._build_rings_js()
+        self._static_airports_js = self._build_airports_js()
+        # The folium HTML is assembled in the thread pool and handed back to setHtml
+        self._map_render_busy = False
+        self._map_render_signals = MapRenderSignals(self)
+        self._map_render_signals.html_ready.connect(self._on_map_html)
+        self._map_render_signals.render_failed.connect(self._on_map_render_failed)
+        self.render_base_map()
+
         # --- 2. Control Bar (Bottom) ---
         control_widget = QWidget()
         control_widget.setStyleSheet("background-color: black;")
@@ -454,12 +792,25 @@ class AdsbTracker(QMainWindow):
         # Top-Left Plot: Altitude vs Distance Scatter
         self.scatter_dist_canvas = AdsbMapCanvas(self, width=5, height=4, dpi=100)
         self.scatter_dist_ax = self.scatter_dist_canvas.fig.add_subplot(111)
+        self._style_ax(self.scatter_dist_ax, 'Distance from Receiver (miles)', 'Altitude (feet)', grid=True)
+        # Pixel markers on a single Line2D, 'alpha=0.5' makes them semi-transparent
+        self.scatter_dist_line, = self.scatter_dist_ax.plot(
+            [], [], linestyle='', marker=',', color='#00FF00', alpha=0.5, rasterized=True
+        )
+        self.scatter_dist_image = None  # Density image, created once there are too many points
+        self.scatter_dist_canvas.add_animated(self.scatter_dist_line)
         left_plot_splitter.addWidget(self.scatter_dist_canvas)
 
         # --- SWAP 1 (Bottom-Left) ---
         # Bottom-Left Plot: Altitude vs Groundspeed Scatter (MOVED)
         self.scatter_gs_canvas = AdsbMapCanvas(self, width=5, height=4, dpi=100)
         self.scatter_gs_ax = self.scatter_gs_canvas.fig.add_subplot(111)
+        self._style_ax(self.scatter_gs_ax, 'Groundspeed (knots)', 'Altitude (feet)', grid=True)
+        self.scatter_gs_line, = self.scatter_gs_ax.plot(
+            [], [], linestyle='', marker=',', color='#00FF00', alpha=0.5, rasterized=True
+        )
+        self.scatter_gs_image = None
+        self.scatter_gs_canvas.add_animated(self.scatter_gs_line)
         left_plot_splitter.addWidget(self.scatter_gs_canvas)
 
         main_plot_splitter.addWidget(left_plot_splitter)  # Add left column
@@ -472,14 +823,35 @@ class AdsbTracker(QMainWindow):
         # Top-Right Plot: Altitude Histogram (MOVED)
         self.hist_alt_canvas = AdsbMapCanvas(self, width=5, height=4, dpi=100)
         self.hist_alt_ax = self.hist_alt_canvas.fig.add_subplot(111)
+        self._style_ax(self.hist_alt_ax, 'Altitude (feet)', 'Aircraft Count', xlim=(0, 50000))
+        # 100 fixed bins from 0 to 50,000 ft; bar heights are updated in place
+        self._alt_bins = np.linspace(0, 50000, 101)
+        self._alt_counts = np.zeros(100, dtype=np.int64)
+        self.hist_alt_bars = self.hist_alt_ax.bar(
+            self._alt_bins[:-1], np.zeros(100), width=np.diff(self._alt_bins), align='edge', color='#00FF00'
+        )
+        self.hist_alt_canvas.add_animated(*self.hist_alt_bars)
         right_plot_splitter.addWidget(self.hist_alt_canvas)
 
         # Bottom-Right Plot: Groundspeed Histogram (NEW)
         self.hist_gs_canvas = AdsbMapCanvas(self, width=5, height=4, dpi=100)
         self.hist_gs_ax = self.hist_gs_canvas.fig.add_subplot(111)
+        self._style_ax(self.hist_gs_ax, 'Groundspeed (knots)', 'Aircraft Count', xlim=(0, 600))
+        # 100 fixed bins up to a reasonable max groundspeed of 600 knots
+        self._gs_bins = np.linspace(0, 600, 101)
+        self._gs_counts = np.zeros(100, dtype=np.int64)
+        self.hist_gs_bars = self.hist_gs_ax.bar(
+            self._gs_bins[:-1], np.zeros(100), width=np.diff(self._gs_bins), align='edge', color='#00FF00'
+        )
+        self.hist_gs_canvas.add_animated(*self.hist_gs_bars)
         right_plot_splitter.addWidget(self.hist_gs_canvas)
 
         main_plot_splitter.addWidget(right_plot_splitter)  # Add right column
+
+        # --- MODIFICATION: Add tight_layout to prevent cutoff ---
+        # Laid out once here; the canvases redo it on resize
+        for canvas in (self.scatter_dist_canvas, self.scatter_gs_canvas, self.hist_alt_canvas, self.hist_gs_canvas):
+            canvas.fig.tight_layout()
         # --- END MODIFICATION ---
 
         right_layout.addWidget(main_plot_splitter)
@@ -510,34 +882,36 @@ class AdsbTracker(QMainWindow):
         # The main update_data timer will automatically pick up this
         # state change on its next cycle.
 
+    def airports_near(self, lat, lon, dist_miles):
+        """Returns the codes of the airports within dist_miles of (lat, lon)."""
+        if self.airport_tree is None:
+            return []
+        # Convert the great-circle distance to a straight-line chord on the unit sphere
+        chord = 2 * math.sin(dist_miles / EARTH_RADIUS_MILES / 2)
+        indices = self.airport_tree.query_ball_point(toUnitVectors([lat], [lon])[0], r=chord)
+        return [self.airport_codes[i] for i in indices]
+
     # --- ADDED: Methods to control zoom ---
     def zoom_in(self):
-        """Increases the map zoom level, persisting on reload."""
-        # Cap max zoom at 18
-        self.current_zoom = min(18, self.current_zoom + 0.5)
-        print(f"Zoom set to: {self.current_zoom}")
+        """Increases the map zoom level."""
+        # Step from the page's live zoom (the wheel may have changed it); cap max zoom at 18
+        self.map_view.page().runJavaScript("adsbMap.setZoom(Math.min(18, adsbMap.getZoom() + 1));")
 
     def zoom_out(self):
-        """Decreases the map zoom level, persisting on reload."""
-        # Cap min zoom at 4
-        self.current_zoom = max(4, self.current_zoom - 0.5)
-        print(f"Zoom set to: {self.current_zoom}")
+        """Decreases the map zoom level."""
+        # Step from the page's live zoom (the wheel may have changed it); cap min zoom at 4
+        self.map_view.page().runJavaScript("adsbMap.setZoom(Math.max(4, adsbMap.getZoom() - 1));")
 
     # --- END ADDITION ---
 
-    def fetch_aircraft_data(self):
-        """Fetches and processes aircraft data from the receiver."""
+    def process_aircraft_data(self, data):
+        """Processes aircraft data fetched from the receiver."""
         try:
-            # Set a short timeout to avoid blocking the GUI
-            response = requests.get(DATA_URL, timeout=2.0)
-            response.raise_for_status()  # Raise an error for bad responses
-            data = response.json()
-
-            new_distances = []
+            new_lats = []
+            new_lons = []
             new_altitudes = []
             # --- MODIFICATION: Added list for new groundspeeds ---
             new_groundspeeds = []
-            receiver_pos = (RECEIVER_LAT, RECEIVER_LON)
 
             # Use a temp dict to update aircraft positions
             temp_aircraft_seen = {}
@@ -565,55 +939,38 @@ class AdsbTracker(QMainWindow):
                 except ValueError:
                     continue
 
-                # Calculate distance
-                ac_pos = (lat, lon)
-                dist_miles = haversine(receiver_pos, ac_pos, unit=Unit.MILES)
-
                 # --- MODIFICATION: Get groundspeed ---
                 gs_val = ac.get('gs')
-                gs_float = None  # Default to None
+                gs_float = math.nan  # Default to NaN (missing)
                 if gs_val is not None and gs_val != 'N/A':
                     try:
                         gs_float = float(gs_val)
                     except ValueError:
-                        pass  # Keep gs_float as None if conversion fails
+                        pass  # Keep gs_float as NaN if conversion fails
 
                 # Add to our lists for this update cycle
-                new_distances.append(dist_miles)
+                new_lats.append(lat)
+                new_lons.append(lon)
                 new_altitudes.append(alt_ft)
-                new_groundspeeds.append(gs_float)  # Append the float or None
+                new_groundspeeds.append(gs_float)  # Append the float or NaN
 
                 # Store for map
                 hex_code = ac.get('hex', str(time.time()))  # Use time as fallback key
                 current_hex_codes.add(hex_code)
-                temp_aircraft_seen[hex_code] = {
-                    'lat': lat,
-                    'lon': lon,
-                    'alt': alt_ft,
-                    'flight': ac.get('flight', 'N/A').strip(),
-                    # --- CHANGE 2: Store groundspeed ---
-                    'gs': ac.get('gs', 'N/A')
-                }
+                temp_aircraft_seen[hex_code] = Aircraft(
+                    lat, lon, ac.get('flight', 'N/A').strip(), alt_ft,
+                    # --- CHANGE 2: Store groundspeed (NaN if missing) ---
+                    gs_float, hex_code
+                )
 
                 # --- Track Line Logic ---
-                # Get existing track, or a new empty list
-                track = self.aircraft_tracks.get(hex_code, [])
-
-                # Append new position
-                track.append([lat, lon])
+                # Append new position to the existing track (or a new one);
+                # the deque drops the oldest point once MAX_TRACK_POINTS is reached
+                self.aircraft_tracks.setdefault(hex_code, deque(maxlen=MAX_TRACK_POINTS)).append([lat, lon])
 
-                # Limit track length
-                if len(track) > MAX_TRACK_POINTS:
-                    track = track[-MAX_TRACK_POINTS:]
-
-                # Store the updated track
-                self.aircraft_tracks[hex_code] = track
-
-            # Update cumulative lists
-            self.all_distances.extend(new_distances)
-            self.all_altitudes.extend(new_altitudes)
-            # --- MODIFICATION: Update cumulative groundspeeds ---
-            self.all_groundspeeds.extend(new_groundspeeds)
+            # Update cumulative buffers (distances are calculated straight into them)
+            self._append_samples(np.asarray(new_lats, dtype=float), np.asarray(new_lons, dtype=float),
+                                 np.asarray(new_altitudes, dtype=float), np.asarray(new_groundspeeds, dtype=float))
 
             # Update the main aircraft dictionary
             self.current_aircraft = temp_aircraft_seen
@@ -629,36 +986,126 @@ class AdsbTracker(QMainWindow):
 
             return True  # Success
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching data: {e}")
         except Exception as e:
             print(f"Error processing data: {e}")
 
         return False  # Failure
 
+    def _append_samples(self, lats, lons, altitudes, groundspeeds):
+        """Batch-appends one update cycle of samples to the cumulative buffers."""
+        k = len(lats)
+        gs_valid = np.isfinite(groundspeeds)
+
+        # Histogram counts only need this cycle's samples binned and added on;
+        # they cover every sample, including ones later thinned out of the buffers
+        self._alt_counts += np.histogram(altitudes, bins=self._alt_bins)[0]
+        self._gs_counts += np.histogram(groundspeeds[gs_valid], bins=self._gs_bins)[0]
+
+        # When full, keep every second sample so the plots still span the whole history.
+        # Thin into fresh arrays: the plot worker may still be reading the current ones,
+        # which are otherwise only ever written past self._n
+        while self._n + k > self._cap:
+            kept = (self._n + 1) // 2
+            for name in ('_dist_buf', '_alt_buf', '_gs_buf', '_gs_valid'):
+                old = getattr(self, name)
+                new = np.empty_like(old)
+                new[:kept] = old[:self._n:2]
+                setattr(self, name, new)
+            self._n = kept
+
+        end = self._n + k
+        # Calculate distances for all aircraft at once, written directly into the buffer
+        hav_miles(RECEIVER_LAT, RECEIVER_LON, lats, lons, out=self._dist_buf[self._n:end])
+        self._alt_buf[self._n:end] = altitudes
+        self._gs_buf[self._n:end] = groundspeeds
+        self._gs_valid[self._n:end] = gs_valid
+        self._n = end
+
     def update_data(self):
-        """Timer-driven function to update all UI elements."""
-        if self.fetch_aircraft_data():
-            # If data fetch was successful, update all GUI elements
-            self.update_map()
-            # --- MODIFICATION: Call all four plot updaters ---
-            self.update_scatter_dist_plot()
-            self.update_hist_alt_plot()
-            self.update_scatter_gs_plot()
-            self.update_hist_gs_plot()
+        """Timer-driven function that starts a background fetch of aircraft data."""
+        # Skip this cycle if the previous fetch hasn't finished yet
+        if not self.fetcher.isRunning():
+            self.fetcher.start()
+
+    def _on_data(self, data):
+        """Called on the GUI thread when the fetcher has new aircraft data."""
+        if self.process_aircraft_data(data):
+            # If data processing was successful, update all GUI elements
+            self.schedule_refresh()
         else:
-            # Optional: handle failed update (e.g., show "Disconnected")
             print("Data update failed, skipping GUI refresh.")
 
-    def update_map(self):
-        """Refreshes the folium map with current aircraft positions."""
-
-        # 1. Create a new map instance
+    def schedule_refresh(self):
+        """Coalesces refresh requests so the map and plots redraw at most every 100 ms."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(100, self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Runs the refresh requested by schedule_refresh."""
+        self._refresh_pending = False
+        self.update_map()
+        self.request_plot_refresh()
+
+    def request_plot_refresh(self):
+        """Hands the current samples to the plot worker, unless it is still busy with the last ones."""
+        if self._plot_prep_busy:
+            return
+        self._plot_prep_busy = True
+        n = self._n
+        self.plot_requested.emit((self._dist_buf[:n], self._alt_buf[:n], self._gs_buf[:n], self._gs_valid[:n]))
+
+    def _on_plot_data(self, data):
+        """Called on the GUI thread with prepared plot arrays; pushes them into the plots."""
+        self._plot_prep_busy = False
+        # --- MODIFICATION: Call all four plot updaters ---
+        self.update_scatter_dist_plot(data['dist'])
+        self.update_hist_alt_plot()
+        self.update_scatter_gs_plot(data['gs'])
+        self.update_hist_gs_plot()
+
+    def _on_fetch_failed(self, message):
+        """Called on the GUI thread when the fetcher could not get data."""
+        print(message)
+        # Optional: handle failed update (e.g., show "Disconnected")
+        print("Data update failed, skipping GUI refresh.")
+
+    def closeEvent(self, event):
+        """Stops polling and waits for a running fetch before the window closes."""
+        self.timer.stop()
+        self.fetcher.wait()
+        self.plot_thread.quit()
+        self.plot_thread.wait()
+        QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(event)
+
+    def render_base_map(self):
+        """Starts building the map HTML in the thread pool, unless a build is already running."""
+        if self._map_render_busy:
+            return
+        self._map_render_busy = True
+        QThreadPool.globalInstance().start(MapRenderer(self._build_base_map, self._map_render_signals))
+
+    def _on_map_html(self, html):
+        """Loads the finished map HTML into the web view."""
+        self._map_render_busy = False
+        self.map_view.setHtml(html)
+
+    def _on_map_render_failed(self, message):
+        """Reports a failed map build."""
+        self._map_render_busy = False
+        print(message)
+
+    def _build_base_map(self):
+        """Builds the static map HTML; aircraft are pushed into it by update_map."""
+
+        # 1. Create the map instance
         # --- MODIFIED: Use self.current_zoom instead of MAP_START_ZOOM ---
         m = folium.Map(location=[RECEIVER_LAT, RECEIVER_LON],
                        zoom_start=self.current_zoom,
                        tiles=None,  # Removed map tiles
-                       zoom_control=False)  # Disable zoom buttons
+                       zoom_control=False,  # Disable zoom buttons
+                       prefer_canvas=True)  # Draw vector markers on one canvas instead of one SVG node each
 
         # --- UPDATED MODIFICATION: Inject CSS to force black background and hide Leaflet logo ---
         # This styles the HTML body AND the Leaflet map container
@@ -678,10 +1125,14 @@ class AdsbTracker(QMainWindow):
         m.get_root().header.add_child(folium.Element(black_bg_style))
         # --- END UPDATED MODIFICATION ---
 
+        # Qt's QWebChannel client, used to report the visible map bounds back to Python
+        m.get_root().header.add_child(folium.JavascriptLink('qrc:///qtwebchannel/qwebchannel.js'))
+
         # --- CHANGE 3: Add Aircraft Count ---
-        ac_count = len(self.current_aircraft)
-        count_html = f"""
-        <div style="position: fixed; 
+        # The count is updated in place by updateAircraft()
+        count_html = """
+        <div id="aircraft-count"
+             style="position: fixed; 
                     bottom: 10px; 
                     left: 10px; 
                     z-index: 1000; 
@@ -692,7 +1143,7 @@ class AdsbTracker(QMainWindow):
                     background-color: rgba(0, 0, 0, 1);
                     padding: 5px 10px;
                     border-radius: 5px;">
-            Aircraft: {ac_count}
+            Aircraft: 0
         </div>
         """
         m.get_root().html.add_child(folium.Element(count_html))
@@ -700,46 +1151,34 @@ class AdsbTracker(QMainWindow):
 
         # --- Add US State Outlines for VA, MD, and DC ---
 
-        # Define a style function for the GeoJSON layer
-        state_style = lambda x: {
-            'fillColor': 'none',  # No fill
-            'color': '#FFFFFF',  # White outline
-            'weight': 0.5,  # Thin line
-            'fillOpacity': 0,  # No fill opacity
-        }
+        # The GeoJSON strings are injected as-is into raw L.geoJSON() calls, so folium
+        # doesn't have to parse and re-serialize the (multi-MB) border data
 
         # --- MODIFICATION: Use combined state data ---
         if self.world_data:  # Only plot if data was loaded successfully
-            folium.GeoJson(
-                name='World Borders',
-                style_function=state_style,
-                overlay=True,
-                control=False,  # Do not add to layer control
-                # The property name in these files is 'NAME'
-                #   tooltip=folium.features.GeoJsonTooltip(fields=['NAME']),
-                highlight_function=lambda x: {'fillColor': '#00FF00', 'color': '#00FF00', 'weight': 3,
-                                              'fillOpacity': 0.1},
-                # Use the pre-combined data
-                data=self.world_data,
-            ).add_to(m)
+            MapScript(f"""
+                var borderStyle = {{fillColor: 'none', color: '#FFFFFF', weight: 0.5, fillOpacity: 0}};
+                var highlightStyle = {{fillColor: '#00FF00', color: '#00FF00', weight: 3, fillOpacity: 0.1}};
+                L.geoJSON({self.world_data}, {{
+                    style: function () {{ return borderStyle; }},
+                    onEachFeature: function (feature, layer) {{
+                        layer.on({{
+                            mouseover: function (e) {{ e.target.setStyle(highlightStyle); }},
+                            mouseout: function (e) {{ e.target.setStyle(borderStyle); }}
+                        }});
+                    }}
+                }}).addTo(map);
+            """).add_to(m)
         # --- END MODIFICATION ---
 
         # --- ADD: European Regions Layer ---
         if self.regions_data:
-            region_style = lambda x: {
-                'fillColor': 'none',
-                'color': '#666666',
-                'weight': 0.5,
-                'fillOpacity': 0,
-            }
-
-            folium.GeoJson(
-                name='European Regions',
-                style_function=region_style,
-                overlay=True,
-                control=False,
-                data=self.regions_data,
-            ).add_to(m)
+            MapScript(f"""
+                var regionStyle = {{fillColor: 'none', color: '#666666', weight: 0.5, fillOpacity: 0}};
+                L.geoJSON({self.regions_data}, {{
+                    style: function () {{ return regionStyle; }}
+                }}).addTo(map);
+            """).add_to(m)
         # --- END ADD ---
 
         # 2. Add a marker for the receiver (Triangle)
@@ -757,51 +1196,7 @@ class AdsbTracker(QMainWindow):
         ).add_to(m)
 
         # --- CHANGE 4: Add labeled distance rings ---
-        DEG_LAT_PER_METER = 1 / 111111  # Approx
-
-        # Radii from original code
-        rings_to_plot = [
-            (80467 / 5, " 10 mi"),  # 10 miles
-            (2 * 80467 / 5, "20 mi"),  # 20 miles
-            (3 * 80467 / 5, "30 mi"),  # 30 miles
-            (4 * 80467 / 5, "40 mi"),  # 40 miles
-            (80467, "50 mi")  # 50 miles
-        ]
-
-        for radius_m, label_txt in rings_to_plot:
-            # Make rings white
-            folium.Circle(
-                location=[RECEIVER_LAT, RECEIVER_LON],
-                radius=radius_m,
-                color="#FFFFFF",  # White
-                fill=False,
-                opacity=0.75,
-                weight=1
-            ).add_to(m)
-
-            # Add label at 6 o' clock
-            # Calculate 6 o'clock position (approx)
-            label_lat = RECEIVER_LAT - (radius_m * DEG_LAT_PER_METER)
-            label_lon = RECEIVER_LON
-
-            folium.Marker(
-                location=[label_lat, label_lon],
-                icon=folium.DivIcon(
-                    icon_size=(50, 20),
-                    icon_anchor=(25, 10),  # Center the icon on the lat/lon
-                    html=(
-                        f'<div style="font-size: 8pt; font-weight: bold;'
-                        f'color: rgba(255, 255, 255, 0.75);'
-                        f'background-color: black;'
-                        f'padding: 2px 4px; border-radius: 3px; white-space: nowrap; '
-                        f'display: flex; align-items: center; justify-content: center; '
-                        f'width: 100%; height: 100%; box-sizing: border-box;">'
-                        f'{label_txt}'
-                        f'</div>'
-                    )
-                )
-            ).add_to(m)
-
+        MapScript(self._static_rings_js).add_to(m)
         # --- END CHANGE 4 ---
 
         # 4. Add DC Airspace if enabled
@@ -831,343 +1226,428 @@ class AdsbTracker(QMainWindow):
 
         # 5. Add markers for local airports if enabled
         if PLOT_AIRPORTS == 1:
-            # Loop over new data structure: (lat, lon, status)
-            for code, (lat, lon, status) in self.airport_location.items():
-
-                # Set outline color based on tower status
-                if status == "towered":
-                    outline_color = "#FFFFFF"  # White
-                    fill_color_set = "#FFFFFF"  # White
-                else:
-                    outline_color = "#404040"  # Gray
-                    fill_color_set = "#404040"  # Gray
-
-                folium.RegularPolygonMarker(
-                    location=[lat, lon],
-                    popup=code,
-                    number_of_sides=4,  # Square
-                    radius=6,
-                    rotation=45,  # Rotate square to look like a diamond
-                    color=outline_color,  # Use the conditional color
-                    fill=True,
-                    fill_color=fill_color_set,  # Black fill
-                    fill_opacity=1.0,
-                    weight=2
-                ).add_to(m)
-
-                # --- CHANGE 1: Add airport callsign text ---
-                folium.Marker(
-                    location=[lat, lon],
-                    icon=folium.DivIcon(
-                        icon_size=(150, 36),
-                        icon_anchor=(0, 0),  # Anchor at top-left
-                        # Style: 9pt, 500 weight, color from variable, 10px right, 7px up, no wrapping
-                        html=f'<div style="font-size: 9pt; font-weight: 500; color: {outline_color}; margin-left: 10px; margin-top: -7px; white-space: nowrap;">{code}</div>',
-                    )
-                ).add_to(m)
-                # --- END CHANGE 1 ---
-
-        # 6. Conditionally plot aircraft and tracks
-        if KEEP_ALL_TRACKS == 1:
-            # --- Plotting Mode 1: Persistent Tracks ---
-
-            # 6a. Add persistent track lines for ALL stored aircraft
-            for hex_code, track in self.aircraft_tracks.items():
-                if track and len(track) >= 2:
-                    folium.PolyLine(
-                        track,
-                        color='#00FF00',  # Green
-                        weight=2,
-                        dash_array='2,4',
-                        opacity=1
-                    ).add_to(m)
-
-            # 6b. Add markers for each CURRENTLY visible aircraft
-            for hex_code, ac in self.current_aircraft.items():
-                popup_html = (
-                    f"<b>Flight: {ac['flight']}</b><br>"
-                    f"Altitude: {ac['alt']:,} ft<br>"
-                    f"Hex: {hex_code.upper()}"
-                )
-
-                # --- Add Aircraft Icon (Green Circle) ---
-                folium.CircleMarker(
-                    location=[ac['lat'], ac['lon']],
-                    radius=3,
-                    color='#00FF00',  # Green
-                    weight=1.5,
-                    fill=False,
-                    fill_color='#000000',
-                    fill_opacity=1.0,
-                    popup=popup_html
-                ).add_to(m)
-
-                # --- MODIFICATION: Only draw labels if toggled ON ---
-                if self.show_labels:
-                    # --- CHANGE 2: Add Callsign, Alt, and Speed Text ---
-                    # Prep for Alt/GS label
-                    try:
-                        alt_str = f"{int(ac['alt']):,}'"
-                    except (ValueError, TypeError):
-                        alt_str = "N/A"
-
-                    try:
-                        # Handle 'N/A' or missing gs
-                        gs_val = float(ac['gs'])
-                        gs_str = f"{int(gs_val)} kts"
-                    except (ValueError, TypeError):
-                        gs_str = "N/A"
-
-                    alt_gs_label = f"{alt_str} @ {gs_str}"
-
-                    folium.Marker(
-                        location=[ac['lat'], ac['lon']],
-                        icon=folium.DivIcon(
-                            icon_size=(150, 36),
-                            icon_anchor=(0, 0),  # Anchor at top-left
-                            # Style text: 9pt, 500 weight, green, 10px right, 7px up, 2 lines
-                            html=(
-                                f'<div style="font-size: 9pt; font-weight: 500; color: #00FF00; margin-left: 10px; margin-top: -7px; line-height: 1.2;">'
-                                f'<span style="white-space: nowrap;">{ac["flight"]}</span><br>'
-                                f'<span style="white-space: nowrap;">{alt_gs_label}</span>'
-                                f'</div>'
-                            )
-                        )
-                    ).add_to(m)
-                    # --- END CHANGE 2 ---
+            MapScript(self._static_airports_js).add_to(m)
+
+        # 6. Add empty layers for aircraft and tracks, plus the JS that diffs updates into them
+        track_weight = 2 if KEEP_ALL_TRACKS == 1 else 1
+        MapScript(f"""
+            window.adsbMap = map;
+            // Aircraft and tracks share one canvas renderer; the padding keeps markers drawn
+            // half a screen beyond the view so panning doesn't show empty edges
+            var aircraftRenderer = L.canvas({{padding: 0.5}});
+
+            // All tracks are one multi-part polyline, reshaped in place on every update
+            window.trackLine = L.polyline([], {{
+                color: '#00FF00', weight: {track_weight}, opacity: 1,
+                renderer: aircraftRenderer
+            }}).addTo(map);
+            // Live markers keyed by aircraft hex, so updates move them instead of recreating them
+            window.markerIndex = {{}};
+
+            function popupHtml(p) {{
+                return '<b>Flight: ' + p.flight + '</b><br>' +
+                       'Altitude: ' + p.alt.toLocaleString('en-US') + ' ft<br>' +
+                       'Hex: ' + p.hex.toUpperCase();
+            }}
+
+            function labelIcon(html) {{
+                return L.divIcon({{className: 'empty', iconSize: {list(LABEL_ICON_SIZE)}, iconAnchor: {list(LABEL_ICON_ANCHOR)}, html: html}});
+            }}
+
+            // One GeoJSON layer for all aircraft; popups are built from the feature properties
+            window.aircraftLayer = L.geoJSON(null, {{
+                pointToLayer: function (feature, latlng) {{
+                    // --- Add Aircraft Icon (Green Circle) ---
+                    return L.circleMarker(latlng, {{
+                        radius: 3, color: '#00FF00', weight: 1.5,
+                        fill: false, fillColor: '#000000', fillOpacity: 1.0,
+                        renderer: aircraftRenderer
+                    }});
+                }},
+                onEachFeature: function (feature, layer) {{
+                    layer.bindPopup(popupHtml(feature.properties));
+                    markerIndex[feature.properties.hex] = {{marker: layer, label: null, labelHtml: null}};
+                }}
+            }}).addTo(map);
+            window.labelLayer = L.layerGroup().addTo(map);
+
+            window.updateAircraft = function (data) {{
+                // Tracks arrive as one GeoJSON MultiLineString ([lon, lat] order)
+                trackLine.setLatLngs(L.GeoJSON.coordsToLatLngs(data.tracks.coordinates, 1));
+
+                // Aircraft: move known markers, add new ones, remove stale ones
+                var seen = {{}};
+                data.aircraft.features.forEach(function (feature) {{
+                    var p = feature.properties;
+                    var c = feature.geometry.coordinates;
+                    var latlng = [c[1], c[0]];
+                    seen[p.hex] = true;
+
+                    var entry = markerIndex[p.hex];
+                    if (entry) {{
+                        entry.marker.feature = feature;
+                        entry.marker.setLatLng(latlng).setPopupContent(popupHtml(p));
+                    }} else {{
+                        aircraftLayer.addData(feature);  // onEachFeature registers it in markerIndex
+                        entry = markerIndex[p.hex];
+                    }}
+
+                    // Label is only sent when labels are toggled ON
+                    if (p.label) {{
+                        if (!entry.label) {{
+                            entry.label = L.marker(latlng, {{icon: labelIcon(p.label)}}).addTo(labelLayer);
+                        }} else {{
+                            entry.label.setLatLng(latlng);
+                            if (entry.labelHtml !== p.label) {{
+                                entry.label.setIcon(labelIcon(p.label));
+                            }}
+                        }}
+                        entry.labelHtml = p.label;
+                    }} else if (entry.label) {{
+                        labelLayer.removeLayer(entry.label);
+                        entry.label = null;
+                        entry.labelHtml = null;
+                    }}
+                }});
+                Object.keys(markerIndex).forEach(function (hex) {{
+                    if (!seen[hex]) {{
+                        aircraftLayer.removeLayer(markerIndex[hex].marker);
+                        if (markerIndex[hex].label) {{
+                            labelLayer.removeLayer(markerIndex[hex].label);
+                        }}
+                        delete markerIndex[hex];
+                    }}
+                }});
+
+                document.getElementById('aircraft-count').textContent = 'Aircraft: ' + data.count;
+            }};
+
+            // Report the visible bounds, padded by the same half screen the canvas renderer draws
+            // beyond the view, so Python sends every aircraft that can be on the canvas
+            if (typeof QWebChannel !== 'undefined') {{
+                new QWebChannel(qt.webChannelTransport, function (channel) {{
+                    var bridge = channel.objects.bridge;
+                    var reportBounds = function () {{
+                        var b = map.getBounds().pad(0.5);
+                        bridge.boundsChanged(b.getSouth(), b.getWest(), b.getNorth(), b.getEast());
+                    }};
+                    map.on('moveend', reportBounds);
+                    reportBounds();
+                }});
+            }}
+        """).add_to(m)
+
+        # 7. Render the map straight to an HTML string for the web view
+        return m.get_root().render()
+
+    def _build_rings_js(self):
+        """Builds the Leaflet JS that draws the labeled distance rings onto one static layer."""
+        DEG_LAT_PER_METER = 1 / 111111  # Approx
 
-        else:
-            # --- Plotting Mode 0: Only Current Tracks ---
-
-            # 6c. Add markers and tracks for each CURRENTLY visible aircraft
-            for hex_code, ac in self.current_aircraft.items():
-                popup_html = (
-                    f"<b>Flight: {ac['flight']}</b><br>"
-                    f"Altitude: {ac['alt']:,} ft<br>"
-                    f"Hex: {hex_code.upper()}"
-                )
+        # Radii from original code
+        rings_to_plot = [
+            (80467 / 5, " 10 mi"),  # 10 miles
+            (2 * 80467 / 5, "20 mi"),  # 20 miles
+            (3 * 80467 / 5, "30 mi"),  # 30 miles
+            (4 * 80467 / 5, "40 mi"),  # 40 miles
+            (80467, "50 mi")  # 50 miles
+        ]
 
-                # --- Add Track Line ---
-                track = self.aircraft_tracks.get(hex_code)
-                if track and len(track) >= 2:
-                    folium.PolyLine(
-                        track,
-                        color='#00FF00',  # Green
-                        dash_array='2,4',
-                        weight=1
-
-                    ).add_to(m)
-
-                # --- Add Aircraft Icon (Green Circle) ---
-                folium.CircleMarker(
-                    location=[ac['lat'], ac['lon']],
-                    radius=3,
-                    color='#00FF00',  # Green
-                    weight=1.5,
-                    fill=False,
-                    fill_color='#000000',
-                    fill_opacity=1.0,
-                    popup=popup_html
-                ).add_to(m)
-
-                # --- MODIFICATION: Only draw labels if toggled ON ---
-                if self.show_labels:
-                    # --- CHANGE 2: Add Callsign, Alt, and Speed Text ---
-                    # Prep for Alt/GS label
-                    try:
-                        alt_str = f"{int(ac['alt']):,}'"
-                    except (ValueError, TypeError):
-                        alt_str = "N/A"
+        rings = []
+        for radius_m, label_txt in rings_to_plot:
+            rings.append({
+                'radius': radius_m,
+                # Add label at 6 o' clock
+                # Calculate 6 o'clock position (approx)
+                'labelLat': RECEIVER_LAT - (radius_m * DEG_LAT_PER_METER),
+                'labelHtml': (
+                    f'<div style="font-size: 8pt; font-weight: bold;'
+                    f'color: rgba(255, 255, 255, 0.75);'
+                    f'background-color: black;'
+                    f'padding: 2px 4px; border-radius: 3px; white-space: nowrap; '
+                    f'display: flex; align-items: center; justify-content: center; '
+                    f'width: 100%; height: 100%; box-sizing: border-box;">'
+                    f'{label_txt}'
+                    f'</div>'
+                ),
+            })
+
+        return f"""
+            var ringLayer = L.layerGroup().addTo(map);
+            {orjson.dumps(rings).decode()}.forEach(function (ring) {{
+                // Make rings white
+                L.circle([{RECEIVER_LAT}, {RECEIVER_LON}], {{
+                    radius: ring.radius, color: '#FFFFFF', fill: false, opacity: 0.75, weight: 1
+                }}).addTo(ringLayer);
+
+                // Center the label icon on the lat/lon
+                L.marker([ring.labelLat, {RECEIVER_LON}], {{
+                    icon: L.divIcon({{className: 'empty', iconSize: [50, 20], iconAnchor: [25, 10], html: ring.labelHtml}})
+                }}).addTo(ringLayer);
+            }});
+        """
 
-                    try:
-                        # Handle 'N/A' or missing gs
-                        gs_val = float(ac['gs'])
-                        gs_str = f"{int(gs_val)} kts"
-                    except (ValueError, TypeError):
-                        gs_str = "N/A"
-
-                    alt_gs_label = f"{alt_str} @ {gs_str}"
-
-                    folium.Marker(
-                        location=[ac['lat'], ac['lon']],
-                        icon=folium.DivIcon(
-                            icon_size=(150, 36),
-                            icon_anchor=(0, 0),  # Anchor at top-left
-                            # Style text: 9pt, 500 weight, green, 10px right, 7px up, 2 lines
-                            html=(
-                                f'<div style="font-size: 9pt; font-weight: 500; color: #00FF00; margin-left: 10px; margin-top: -7px; line-height: 1.2;">'
-                                f'<span style="white-space: nowrap;">{ac["flight"]}</span><br>'
-                                f'<span style="white-space: nowrap;">{alt_gs_label}</span>'
-                                f'</div>'
-                            )
-                        )
-                    ).add_to(m)
-                    # --- END CHANGE 2 ---
-
-        # 7. Save map to a temporary HTML buffer
-        data = io.BytesIO()
-        m.save(data, close_file=False)
-
-        # 8. Load the HTML into the QWebEngineView
-        self.map_view.setHtml(data.getvalue().decode())
+    def _build_airports_js(self):
+        """Builds the Leaflet JS that draws all airport markers and labels from one GeoJSON batch."""
+        # Loop over data structure: (lat, lon, status)
+        airports_geojson = {
+            'type': 'FeatureCollection',
+            'features': [
+                {
+                    'type': 'Feature',
+                    'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+                    'properties': {'code': code, 'status': status},
+                }
+                for code, (lat, lon, status) in self.airport_location.items()
+            ],
+        }
 
-    # --- MODIFICATION: Renamed function ---
-    def update_scatter_dist_plot(self):
-        """Refreshes the distance vs. altitude scatter plot."""
-        # --- MODIFICATION: Use renamed axis ---
-        self.scatter_dist_ax.clear()
-        # Set background and face color
-        self.scatter_dist_ax.set_facecolor('black')
-
-        if self.all_distances:
-            # 's=5' makes points small, 'alpha=0.3' makes them semi-transparent
-            # Changed color to green
-            self.scatter_dist_ax.scatter(
-                self.all_distances,
-                self.all_altitudes,
-                s=1,
-                alpha=0.5,
-                c='#00FF00'  # Green
-            )
+        return f"""
+            var airportLayer = L.layerGroup().addTo(map);
+            var airports = {orjson.dumps(airports_geojson).decode()};
+            airports.features.forEach(function (feature) {{
+                var latlng = [feature.geometry.coordinates[1], feature.geometry.coordinates[0]];
+                var code = feature.properties.code;
+
+                // Set color based on tower status: white if towered, otherwise gray
+                var color = feature.properties.status === 'towered' ? '#FFFFFF' : '#404040';
+
+                // Circle markers go to the map's canvas renderer (preferCanvas)
+                L.circleMarker(latlng, {{
+                    radius: 5, color: color, fill: true, fillColor: color, fillOpacity: 1.0, weight: 2
+                }}).bindPopup(code).addTo(airportLayer);
+
+                // --- CHANGE 1: Add airport callsign text ---
+                // Style: 9pt, 500 weight, status color, 10px right, 7px up, no wrapping
+                L.marker(latlng, {{
+                    icon: L.divIcon({{
+                        className: 'empty', iconSize: {list(LABEL_ICON_SIZE)}, iconAnchor: {list(LABEL_ICON_ANCHOR)},
+                        html: '<div style="font-size: 9pt; font-weight: 500; color: ' + color + '; ' +
+                              'margin-left: 10px; margin-top: -7px; white-space: nowrap;">' + code + '</div>'
+                    }})
+                }}).addTo(airportLayer);
+            }});
+        """
 
-        # self.scatter_dist_ax.set_title('Distance vs. Altitude', color='#00FF00') # <-- MODIFICATION: REMOVED
-        self.scatter_dist_ax.set_xlabel('Distance from Receiver (miles)', color='#00FF00')
-        self.scatter_dist_ax.set_ylabel('Altitude (feet)', color='#00FF00')
-        self.scatter_dist_ax.set_ylim(bottom=0)
-        self.scatter_dist_ax.set_xlim(left=0)
-        self.scatter_dist_ax.grid(True, linestyle='--', alpha=0.3, color='gray')
+    def _on_map_loaded(self, ok):
+        """Marks the map as ready for aircraft updates once the page has loaded."""
+        self._map_ready = ok
+        if ok:
+            # A freshly loaded page has no aircraft yet, so always push the next update
+            self._last_map_sig = None
+            self.update_map()
 
-        # Set tick colors
-        self.scatter_dist_ax.tick_params(axis='x', colors='#00FF00')
-        self.scatter_dist_ax.tick_params(axis='y', colors='#00FF00')
+    def _on_bounds_changed(self, south, west, north, east):
+        """Stores the visible map bounds and resends the aircraft that are now in view."""
+        # Leaflet reports unwrapped longitudes; a view crossing the antimeridian sends everything
+        if west < -180 or east > 180:
+            self._bbox = None
+        else:
+            self._bbox = (south, west, north, east)
+        self._last_map_sig = None
+        self.update_map()
+
+    def _fmt_labels(self, aircraft):
+        """Formats the callsign / altitude @ groundspeed label HTML for a list of aircraft."""
+        # --- CHANGE 2: Add Callsign, Alt, and Speed Text ---
+        # Prep for Alt/GS label: truncate to whole feet/knots in one pass, N/A where missing (NaN)
+        alts = np.fromiter((ac.alt for ac in aircraft), dtype=np.float64, count=len(aircraft))
+        gss = np.fromiter((ac.gs for ac in aircraft), dtype=np.float64, count=len(aircraft))
+        alt_ok = np.isfinite(alts)
+        gs_ok = np.isfinite(gss)
+        alt_ints = np.where(alt_ok, alts, 0).astype(np.int64).tolist()
+        gs_ints = np.where(gs_ok, gss, 0).astype(np.int64).tolist()
+        alt_strs = [f"{alt:,}'" if ok else "N/A" for alt, ok in zip(alt_ints, alt_ok.tolist())]
+        gs_strs = [f"{gs} kts" if ok else "N/A" for gs, ok in zip(gs_ints, gs_ok.tolist())]
+
+        # Most labels don't change between refreshes, so reuse recently built strings (LRU)
+        cache = self._label_cache
+        labels = []
+        for ac, alt_str, gs_str in zip(aircraft, alt_strs, gs_strs):
+            flight = ac.flight
+            key = (flight, alt_str, gs_str)
+            label_html = cache.get(key)
+            if label_html is None:
+                label_html = LABEL_HTML_PREFIX + flight + LABEL_HTML_MID + alt_str + ' @ ' + gs_str + LABEL_HTML_SUFFIX
+                cache[key] = label_html
+                if len(cache) > LABEL_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            labels.append(label_html)
+        return labels
 
-        # Set spine (border) colors
-        for spine in self.scatter_dist_ax.spines.values():
-            spine.set_edgecolor('#00FF00')
+    def update_map(self):
+        """Pushes the current aircraft positions and tracks into the loaded map."""
+        if not self._map_ready:
+            return
+
+        # Skip the update entirely if nothing shown on the map changed since the last one
+        sig = (self.show_labels,) + tuple(sorted(
+            (ac.hex, round(ac.lat, 4), round(ac.lon, 4), round(ac.alt), ac.flight, ac.gs)
+            for ac in self.current_aircraft.values()
+        ))
+        if sig == self._last_map_sig:
+            return
+        self._last_map_sig = sig
+
+        # Locals for the hot loop below
+        aircraft_tracks = self.aircraft_tracks
+        current_aircraft = self.current_aircraft
+        keep_all_tracks = KEEP_ALL_TRACKS == 1
+        bbox = self._bbox
+
+        # Only aircraft inside the visible map bounds are sent (all of them until bounds are known,
+        # or while the view crosses the antimeridian)
+        if bbox is None:
+            visible = current_aircraft
+        else:
+            south, west, north, east = bbox
+            visible = {
+                hex_code: ac for hex_code, ac in current_aircraft.items()
+                if south <= ac.lat <= north and west <= ac.lon <= east
+            }
 
-        # --- MODIFICATION: Add tight_layout to prevent cutoff ---
-        self.scatter_dist_canvas.fig.tight_layout()
+        # --- MODIFICATION: Only draw labels if toggled ON ---
+        # Labels are formatted for all visible aircraft at once, in the same order as the loop below
+        if self.show_labels:
+            labels = self._fmt_labels(list(visible.values()))
+        else:
+            labels = [None] * len(visible)
 
-        # Redraw the canvas
-        # --- MODIFICATION: Use renamed canvas ---
-        self.scatter_dist_canvas.draw()
+        # Tracks for ALL stored aircraft when keeping tracks, otherwise only current ones, merged
+        # into one MultiLineString; tracks entirely outside the visible bounds are skipped and the
+        # rest are simplified (Douglas-Peucker) to what is visible at the current zoom
+        if bbox is None:
+            tolerance = TRACK_SIMPLIFY_TOLERANCE_DEG
+        else:
+            tolerance = (bbox[2] - bbox[0]) * TRACK_SIMPLIFY_SPAN_FRACTION
+        track_codes = aircraft_tracks.keys() if keep_all_tracks else current_aircraft.keys()
+        track_lines = []
+        for hex_code in track_codes:
+            track = aircraft_tracks.get(hex_code)
+            if track and len(track) >= 2 and (bbox is None or trackInBounds(track, bbox)):
+                line = LineString([(lon, lat) for lat, lon in track])
+                track_lines.append(list(line.simplify(tolerance, preserve_topology=False).coords))
+
+        # One GeoJSON Feature per aircraft; the page builds popups from the properties
+        features = []
+        append_feature = features.append
+        for ac, label_html in zip(visible.values(), labels):
+            append_feature({
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [ac.lon, ac.lat]},
+                'properties': {
+                    'flight': ac.flight,
+                    'alt': ac.alt,
+                    'gs': ac.gs,
+                    'hex': ac.hex,
+                    'label': label_html,
+                },
+            })
+
+        payload = {
+            'count': len(self.current_aircraft),
+            'tracks': {'type': 'MultiLineString', 'coordinates': track_lines},
+            'aircraft': {'type': 'FeatureCollection', 'features': features},
+        }
+        self.map_view.page().runJavaScript(f"updateAircraft({orjson.dumps(payload).decode()});")
 
-    # --- MODIFICATION: Renamed function ---
-    def update_hist_alt_plot(self):
-        """Refreshes the altitude distribution histogram."""
-        # --- MODIFICATION: Use renamed axis ---
-        self.hist_alt_ax.clear()
+    @staticmethod
+    def _style_ax(ax, xlabel, ylabel, xlim=None, grid=False):
+        """Applies the black/green plot styling to an axis (done once, the updates only touch data)."""
         # Set background and face color
-        self.hist_alt_ax.set_facecolor('black')
-
-        if self.all_altitudes:
-            # Plot the cumulative histogram
-            self.hist_alt_ax.hist(
-                self.all_altitudes,
-                bins=100,
-                range=(0, 50000),
-                color='#00FF00'  # Green
-            )
-
-        # self.hist_alt_ax.set_title('Altitude Distribution', color='#00FF00') # <-- MODIFICATION: REMOVED
-        # --- THIS IS THE FIX ---
-        self.hist_alt_ax.set_xlabel('Altitude (feet)', color='#00FF00')
-        self.hist_alt_ax.set_ylabel('Aircraft Count', color='#00FF00')
-        self.hist_alt_ax.set_xlim(0, 50000)
+        ax.set_facecolor('black')
+        ax.set_xlabel(xlabel, color='#00FF00')
+        ax.set_ylabel(ylabel, color='#00FF00')
+        if xlim is not None:
+            ax.set_xlim(*xlim)
+        if grid:
+            ax.grid(True, linestyle='--', alpha=0.3, color='gray')
 
         # Set tick colors
-        self.hist_alt_ax.tick_params(axis='x', colors='#00FF00')
-        self.hist_alt_ax.tick_params(axis='y', colors='#00FF00')
+        ax.tick_params(axis='x', colors='#00FF00')
+        ax.tick_params(axis='y', colors='#00FF00')
 
         # Set spine (border) colors
-        for spine in self.hist_alt_ax.spines.values():
+        for spine in ax.spines.values():
             spine.set_edgecolor('#00FF00')
 
-        # --- MODIFICATION: Add tight_layout to prevent cutoff ---
-        self.hist_alt_canvas.fig.tight_layout()
+    def _update_point_plot(self, ax, line, image_name, plot_data):
+        """Shows plot_data from pointsOrDensity on a scatter axis, as points or as a density image."""
+        image = getattr(self, image_name)
+        if plot_data[0] == 'points':
+            _, xs, ys = plot_data
+            # Update the persistent point line in place
+            line.set_data(xs, ys)
+            line.set_visible(True)
+            if image is not None:
+                image.set_visible(False)
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+            ax.set_ylim(bottom=0, auto=None)  # Keep autoscaling the top
+            ax.set_xlim(left=0, auto=None)  # Keep autoscaling the right
+        else:
+            _, density, extent = plot_data
+            if image is None:
+                image = ax.imshow(density, origin='lower', aspect='auto', extent=extent,
+                                  cmap=DENSITY_CMAP, interpolation='nearest')
+                ax.figure.canvas.add_animated(image)
+                setattr(self, image_name, image)
+            else:
+                image.set_data(density)
+                image.set_extent(extent)
+            image.set_clim(0, density.max() or 1)
+            image.set_visible(True)
+            line.set_visible(False)
+            ax.set_xlim(extent[0], extent[1], auto=None)
+            ax.set_ylim(extent[2], extent[3], auto=None)
 
-        # Redraw the canvas
-        # --- MODIFICATION: Use renamed canvas ---
-        self.hist_alt_canvas.draw()
+    # --- MODIFICATION: Renamed function ---
+    def update_scatter_dist_plot(self, plot_data):
+        """Refreshes the distance vs. altitude scatter plot."""
+        self._update_point_plot(self.scatter_dist_ax, self.scatter_dist_line, 'scatter_dist_image', plot_data)
 
-    # --- MODIFICATION: Added new function for GS scatter ---
-    def update_scatter_gs_plot(self):
-        """Refreshes the groundspeed vs. altitude scatter plot."""
-        self.scatter_gs_ax.clear()
-        self.scatter_gs_ax.set_facecolor('black')
-
-        # Filter data to only include pairs where groundspeed is not None
-        valid_data = [(gs, alt) for gs, alt in zip(self.all_groundspeeds, self.all_altitudes) if gs is not None]
-
-        if valid_data:
-            # Unzip the valid data into separate lists for plotting
-            plot_gs, plot_alt = zip(*valid_data)
-
-            self.scatter_gs_ax.scatter(
-                plot_gs,
-                plot_alt,
-                s=1,
-                alpha=0.5,
-                c='#00FF00'  # Green
-            )
+        # Redraw the canvas (blitted when the axis limits haven't changed)
+        self.scatter_dist_canvas.refresh(self.scatter_dist_ax)
 
-        # self.scatter_gs_ax.set_title('Groundspeed vs. Altitude', color='#00FF00') # <-- MODIFICATION: REMOVED
-        self.scatter_gs_ax.set_xlabel('Groundspeed (knots)', color='#00FF00')
-        self.scatter_gs_ax.set_ylabel('Altitude (feet)', color='#00FF00')  # <-- MODIFICATION: REMOVED
-        self.scatter_gs_ax.set_ylim(bottom=0)
-        self.scatter_gs_ax.set_xlim(left=0)
-        self.scatter_gs_ax.grid(True, linestyle='--', alpha=0.3, color='gray')
+    @staticmethod
+    def _grow_ylim(ax, peak):
+        """Raises a histogram's y-limit in steps, so the limits (and blitting) stay stable between updates."""
+        if peak > ax.get_ylim()[1]:
+            ax.set_ylim(0, peak * 1.25)
 
-        # Set tick colors
-        self.scatter_gs_ax.tick_params(axis='x', colors='#00FF00')
-        self.scatter_gs_ax.tick_params(axis='y', colors='#00FF00')
+    # --- MODIFICATION: Renamed function ---
+    def update_hist_alt_plot(self):
+        """Refreshes the altitude distribution histogram."""
+        # Update the cumulative histogram bars in place
+        counts = self._alt_counts
+        for bar, count in zip(self.hist_alt_bars, counts):
+            bar.set_height(count)
+        self._grow_ylim(self.hist_alt_ax, counts.max())
 
-        # Set spine (border) colors
-        for spine in self.scatter_gs_ax.spines.values():
-            spine.set_edgecolor('#00FF00')
+        # Redraw the canvas (blitted when the axis limits haven't changed)
+        self.hist_alt_canvas.refresh(self.hist_alt_ax)
 
-        # --- MODIFICATION: Add tight_layout to prevent cutoff ---
-        self.scatter_gs_canvas.fig.tight_layout()
+    # --- MODIFICATION: Added new function for GS scatter ---
+    def update_scatter_gs_plot(self, plot_data):
+        """Refreshes the groundspeed vs. altitude scatter plot (known groundspeeds only)."""
+        self._update_point_plot(self.scatter_gs_ax, self.scatter_gs_line, 'scatter_gs_image', plot_data)
 
-        # Redraw the canvas
-        self.scatter_gs_canvas.draw()
+        # Redraw the canvas (blitted when the axis limits haven't changed)
+        self.scatter_gs_canvas.refresh(self.scatter_gs_ax)
 
     # --- MODIFICATION: Added new function for GS histogram ---
     def update_hist_gs_plot(self):
         """Refreshes the groundspeed distribution histogram."""
-        self.hist_gs_ax.clear()
-        self.hist_gs_ax.set_facecolor('black')
-
-        # Filter out None values from groundspeed list
-        valid_gs = [gs for gs in self.all_groundspeeds if gs is not None]
-
-        if valid_gs:
-            # Plot the cumulative histogram
-            self.hist_gs_ax.hist(
-                valid_gs,
-                bins=100,
-                range=(0, 600),  # Set a reasonable max groundspeed
-                color='#00FF00'  # Green
-            )
-
-        # self.hist_gs_ax.set_title('Groundspeed Distribution', color='#00FF00') # <-- MODIFICATION: REMOVED
-        self.hist_gs_ax.set_xlabel('Groundspeed (knots)', color='#00FF00')
-        self.hist_gs_ax.set_ylabel('Aircraft Count', color='#00FF00')  # <-- MODIFICATION: REMOVED
-        self.hist_gs_ax.set_xlim(0, 600)
-
-        # Set tick colors
-        self.hist_gs_ax.tick_params(axis='x', colors='#00FF00')
-        self.hist_gs_ax.tick_params(axis='y', colors='#00FF00')
-
-        # Set spine (border) colors
-        for spine in self.hist_gs_ax.spines.values():
-            spine.set_edgecolor('#00FF00')
-
-        # --- MODIFICATION: Add tight_layout to prevent cutoff ---
-        self.hist_gs_canvas.fig.tight_layout()
-
-        # Redraw the canvas
-        self.hist_gs_canvas.draw()
+        # Update the cumulative histogram bars in place (missing groundspeeds are never counted)
+        counts = self._gs_counts
+        for bar, count in zip(self.hist_gs_bars, counts):
+            bar.set_height(count)
+        self._grow_ylim(self.hist_gs_ax, counts.max())
+
+        # Redraw the canvas (blitted when the axis limits haven't changed)
+        self.hist_gs_canvas.refresh(self.hist_gs_ax)
 
 
 if __name__ == '__main__':